@@ -2,282 +2,646 @@ from __future__ import annotations
 
 import os
 import socket
-from datetime import datetime
+from datetime import date, datetime, timezone
+from itertools import count
+from operator import attrgetter
 
-from typing import Dict, List
+from typing import Any, AsyncIterator, Dict, Hashable, Iterable, List, Set, Tuple, get_args
 from uuid import UUID
 
+import orjson
+from sortedcontainers import SortedList
+
 from fastapi import FastAPI, HTTPException
+from fastapi.exceptions import RequestValidationError
 from fastapi import Query, Path
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
 from typing import Optional
 
-from models.person import PersonCreate, PersonRead, PersonUpdate
-from models.address import AddressCreate, AddressRead, AddressUpdate
+from models.person import (
+    PersonCreate, PersonRead, PersonUpdate,
+    PERSON_CREATE_EXAMPLES, PERSON_READ_EXAMPLES, PERSON_UPDATE_EXAMPLES,
+)
+from models.address import (
+    AddressCreate, AddressRead, AddressUpdate,
+    ADDRESS_CREATE_EXAMPLES, ADDRESS_READ_EXAMPLES, ADDRESS_UPDATE_EXAMPLES,
+)
+from models.cached import CachedJSONModel
 from models.health import Health
-from models.exercise import ExerciseCreate, ExerciseRead, ExerciseUpdate
-from models.workout import WorkoutCreate, WorkoutRead, WorkoutUpdate
+from models.exercise import (
+    ExerciseCreate, ExerciseRead, ExerciseUpdate,
+    EXERCISE_CREATE_EXAMPLES, EXERCISE_READ_EXAMPLES, EXERCISE_UPDATE_EXAMPLES,
+)
+from models.workout import (
+    WorkoutCreate, WorkoutRead, WorkoutUpdate,
+    WORKOUT_CREATE_EXAMPLES, WORKOUT_READ_EXAMPLES, WORKOUT_UPDATE_EXAMPLES,
+)
+from utils.response_cache import ResponseCache
 
 port = int(os.environ.get("FASTAPIPORT", 8000))
 
+# Resolved once at startup; the lookup can block on DNS/NSS and the host's
+# address does not change while the service is running.
+try:
+    LOCAL_IP = socket.gethostbyname(socket.gethostname())
+except OSError:
+    LOCAL_IP = "127.0.0.1"
+
 # -----------------------------------------------------------------------------
 # Fake in-memory "databases"
 # -----------------------------------------------------------------------------
-persons: Dict[UUID, PersonRead] = {}
-addresses: Dict[UUID, AddressRead] = {}
-exercises: Dict[UUID, ExerciseRead] = {}
-workouts: Dict[UUID, WorkoutRead] = {}
+# Keyed by UUID.int: plain ints hash and compare faster than UUID objects.
+persons: Dict[int, PersonRead] = {}
+addresses: Dict[int, AddressRead] = {}
+exercises: Dict[int, ExerciseRead] = {}
+workouts: Dict[int, WorkoutRead] = {}
+
+# Secondary indexes over persons for the equality filters that are selective
+# (uni, email) or nested (address city/country): field -> value -> person IDs.
+person_index: Dict[str, Dict[str, Set[int]]] = {
+    "uni": {}, "email": {}, "city": {}, "country": {},
+}
+
+# Creation order of each person, so index hits (which come out of the sets in
+# hash order) can be returned in the same order as an unfiltered list.
+person_positions: Dict[int, int] = {}
+
+# (duration_minutes, store key) for workouts with a duration, so the
+# minimum-duration filter is a bisect plus a tail walk instead of a full scan.
+workouts_by_duration: SortedList = SortedList()
+
+# Store position of each workout key, so the bisected tail can be returned in
+# the same order as an unfiltered list. Overwriting a key keeps its position
+# (as the dict does); only DELETE releases it.
+workout_positions: Dict[int, int] = {}
+next_workout_position = count()
+
+def index_workout(key: int, workout: WorkoutRead) -> None:
+    workout_positions.setdefault(key, next(next_workout_position))
+    if workout.duration_minutes:
+        workouts_by_duration.add((workout.duration_minutes, key))
+
+def unindex_workout(key: int) -> None:
+    workout = workouts.get(key)
+    if workout is not None and workout.duration_minutes:
+        workouts_by_duration.discard((workout.duration_minutes, key))
+
+# Opt-in (PERSON_COLUMNS=1, requires numpy): a columnar mirror of the persons
+# store so scans on the non-indexed fields run vectorized. Only used once the
+# store is large enough for that to beat a plain Python loop.
+if os.environ.get("PERSON_COLUMNS") == "1":
+    from services.person_columns import PersonColumns
+
+    person_columns: Optional[PersonColumns] = PersonColumns()
+else:
+    person_columns = None
+
+COLUMN_SCAN_MIN_ROWS = 10_000
+
+def person_index_keys(person: PersonRead) -> Dict[str, Set[str]]:
+    return {
+        "uni": {person.uni},
+        "email": {person.email},
+        "city": {addr.city for addr in person.addresses},
+        "country": {addr.country for addr in person.addresses},
+    }
+
+def index_person(person: PersonRead) -> None:
+    for field, values in person_index_keys(person).items():
+        for value in values:
+            person_index[field].setdefault(value, set()).add(person.id.int)
+    if person_columns is not None:
+        person_columns.upsert(person)
+
+def unindex_person(person: PersonRead) -> None:
+    for field, values in person_index_keys(person).items():
+        for value in values:
+            ids = person_index[field].get(value)
+            if ids is not None:
+                ids.discard(person.id.int)
+                if not ids:
+                    del person_index[field][value]
+
+def accepts_none(model: type[BaseModel], name: str) -> bool:
+    annotation = model.model_fields[name].annotation
+    return annotation is None or annotation is Any or type(None) in get_args(annotation)
+
+def changes(update: BaseModel, read_model: type[BaseModel]) -> Dict[str, Any]:
+    # Only the fields the client actually sent, plus a refreshed updated_at;
+    # values stay as validated models (e.g. nested addresses) so model_copy
+    # needs no re-validation and no intermediate dump of the stored record.
+    # Update models make every field Optional, so an explicit null is the one
+    # input they accept that the Read model would not; reject it here.
+    fields = {name: getattr(update, name) for name in update.model_fields_set}
+    nulls = [name for name, value in fields.items() if value is None and not accepts_none(read_model, name)]
+    if nulls:
+        raise RequestValidationError([
+            {"type": "none_forbidden", "loc": ("body", name), "msg": "Field may not be null", "input": None}
+            for name in nulls
+        ])
+    fields["updated_at"] = datetime.now(timezone.utc)
+    return fields
+
+# C-level attribute getters for every filterable field, built once at import.
+FILTER_GETTERS: Dict[str, attrgetter] = {
+    name: attrgetter(name)
+    for name in (
+        "street", "city", "state", "postal_code", "country",
+        "name", "muscle_group", "equipment", "difficulty",
+        "uni", "first_name", "last_name", "email", "phone", "birth_date",
+        "user_name", "workout_date",
+    )
+}
+
+def active_filters(**params: Optional[Any]) -> List[Tuple[attrgetter, Any]]:
+    # (getter, expected value) pairs for the query params that were supplied,
+    # so list endpoints can test every filter in a single pass over the store.
+    return [(FILTER_GETTERS[attr], value) for attr, value in params.items() if value is not None]
+
+# Encoded GET bodies keyed per resource namespace; every write to a resource
+# clears its namespace. Filter args form the list keys, so query param order
+# does not fragment the cache.
+response_cache = ResponseCache()
+
+def cached_response(namespace: str, key: Hashable) -> Optional[Response]:
+    body = response_cache.get(namespace, key)
+    if body is None:
+        return None
+    return Response(content=body, media_type="application/json")
+
+def model_response(
+    content: CachedJSONModel, status_code: int = 200, cache: Optional[Tuple[str, Hashable]] = None
+) -> Response:
+    # Stored Read models were validated on the way in; returning their cached
+    # JSON directly skips FastAPI's dump-and-revalidate pass against
+    # response_model (which is still declared on each route for the OpenAPI docs).
+    response = Response(content=content.cached_json(), status_code=status_code, media_type="application/json")
+    if cache is not None:
+        namespace, key = cache
+        response_cache.put(namespace, key, response.body, response_cache.generation(namespace))
+    return response
+
+def request_examples(examples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    # openapi_extra for a route's JSON request body; examples live here rather
+    # than in the models' json_schema_extra so pydantic doesn't carry them.
+    return {"requestBody": {"content": {"application/json": {"examples": named_examples(examples)}}}}
+
+def response_examples(examples: List[Dict[str, Any]], status_code: int = 200) -> Dict[int, Any]:
+    return {status_code: {"content": {"application/json": {"examples": named_examples(examples)}}}}
+
+def named_examples(examples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {f"example{i}": {"value": example} for i, example in enumerate(examples, 1)}
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def stream_response(
+    items: Iterable[CachedJSONModel], cache: Optional[Tuple[str, Hashable]] = None
+) -> StreamingResponse:
+    # Encode list results as a JSON array, flushing roughly every 64 KB so the
+    # whole body is never held in memory. Callers pass a lazy filter over a
+    # snapshot of the store, since handlers may mutate it between chunks.
+    # Bodies small enough for the response cache are kept as they stream out.
+    generation = response_cache.generation(cache[0]) if cache is not None else 0
+
+    async def body() -> AsyncIterator[bytes]:
+        captured: Optional[List[bytes]] = [] if cache is not None else None
+        captured_size = 0
+        buffer = bytearray(b"[")
+        for i, item in enumerate(items):
+            if i:
+                buffer += b","
+            buffer += item.cached_json()
+            if len(buffer) >= STREAM_CHUNK_SIZE:
+                chunk = bytes(buffer)
+                buffer.clear()
+                if captured is not None:
+                    captured.append(chunk)
+                    captured_size += len(chunk)
+                    if captured_size > response_cache.max_body_size:
+                        captured = None
+                yield chunk
+        buffer += b"]"
+        chunk = bytes(buffer)
+        if captured is not None:
+            captured.append(chunk)
+            namespace, key = cache
+            response_cache.put(namespace, key, b"".join(captured), generation)
+        yield chunk
+
+    return StreamingResponse(body(), media_type="application/json")
 
 app = FastAPI(
     title="Person/Address/Exercise/Workout API",
     description="Demo FastAPI app using Pydantic v2 models for Person, Address, Exercise, and Workout",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
+# List endpoints can return every stored record; compress anything non-trivial.
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
 # -----------------------------------------------------------------------------
 # Address endpoints
 # -----------------------------------------------------------------------------
 
-def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Health:
-    return Health(
-        status=200,
-        status_message="OK",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        ip_address=socket.gethostbyname(socket.gethostname()),
-        echo=echo,
-        path_echo=path_echo
-    )
+# Plain /health (no echoes) only varies by timestamp, so its body is
+# prebuilt around that one slot; Health stays the documented response_model.
+HEALTH_PREFIX, HEALTH_SUFFIX = orjson.dumps({
+    "status": 200,
+    "status_message": "OK",
+    "timestamp": "{timestamp}",
+    "ip_address": LOCAL_IP,
+    "echo": None,
+    "path_echo": None,
+}).split(b"{timestamp}")
+
+def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Response:
+    timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    if echo is None and path_echo is None:
+        body = HEALTH_PREFIX + timestamp.encode() + HEALTH_SUFFIX
+    else:
+        body = orjson.dumps({
+            "status": 200,
+            "status_message": "OK",
+            "timestamp": timestamp,
+            "ip_address": LOCAL_IP,
+            "echo": echo,
+            "path_echo": path_echo,
+        })
+    return Response(content=body, media_type="application/json")
 
 @app.get("/health", response_model=Health)
-def get_health_no_path(echo: str | None = Query(None, description="Optional echo string")):
+async def get_health_no_path(echo: str | None = Query(None, description="Optional echo string")):
     # Works because path_echo is optional in the model
     return make_health(echo=echo, path_echo=None)
 
 @app.get("/health/{path_echo}", response_model=Health)
-def get_health_with_path(
+async def get_health_with_path(
     path_echo: str = Path(..., description="Required echo in the URL path"),
     echo: str | None = Query(None, description="Optional echo string"),
 ):
     return make_health(echo=echo, path_echo=path_echo)
 
-@app.post("/addresses", response_model=AddressRead, status_code=201)
-def create_address(address: AddressCreate):
-    if address.id in addresses:
+@app.post(
+    "/addresses",
+    response_model=AddressRead,
+    status_code=201,
+    openapi_extra=request_examples(ADDRESS_CREATE_EXAMPLES),
+    responses=response_examples(ADDRESS_READ_EXAMPLES, 201),
+)
+async def create_address(address: AddressCreate):
+    if address.id.int in addresses:
         raise HTTPException(status_code=400, detail="Address with this ID already exists")
-    addresses[address.id] = AddressRead(**address.model_dump())
-    return addresses[address.id]
+    now = datetime.now(timezone.utc)
+    response_cache.clear("addresses")
+    addresses[address.id.int] = AddressRead.model_construct(**address.__dict__, created_at=now, updated_at=now)
+    return model_response(addresses[address.id.int], status_code=201)
 
 @app.get("/addresses", response_model=List[AddressRead])
-def list_addresses(
+async def list_addresses(
     street: Optional[str] = Query(None, description="Filter by street"),
     city: Optional[str] = Query(None, description="Filter by city"),
     state: Optional[str] = Query(None, description="Filter by state/region"),
     postal_code: Optional[str] = Query(None, description="Filter by postal code"),
     country: Optional[str] = Query(None, description="Filter by country"),
 ):
-    results = list(addresses.values())
-
-    if street is not None:
-        results = [a for a in results if a.street == street]
-    if city is not None:
-        results = [a for a in results if a.city == city]
-    if state is not None:
-        results = [a for a in results if a.state == state]
-    if postal_code is not None:
-        results = [a for a in results if a.postal_code == postal_code]
-    if country is not None:
-        results = [a for a in results if a.country == country]
-
-    return results
-
-@app.get("/addresses/{address_id}", response_model=AddressRead)
-def get_address(address_id: UUID):
-    if address_id not in addresses:
+    key = (street, city, state, postal_code, country)
+    cached = cached_response("addresses", key)
+    if cached is not None:
+        return cached
+
+    filters = active_filters(
+        street=street, city=city, state=state, postal_code=postal_code, country=country
+    )
+    return stream_response(
+        (a for a in list(addresses.values()) if all(get(a) == value for get, value in filters)),
+        cache=("addresses", key),
+    )
+
+@app.get(
+    "/addresses/{address_id}",
+    response_model=AddressRead,
+    responses=response_examples(ADDRESS_READ_EXAMPLES),
+)
+async def get_address(address_id: UUID):
+    cached = cached_response("addresses", address_id.int)
+    if cached is not None:
+        return cached
+    if address_id.int not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    return addresses[address_id]
+    return model_response(addresses[address_id.int], cache=("addresses", address_id.int))
 
-@app.patch("/addresses/{address_id}", response_model=AddressRead)
-def update_address(address_id: UUID, update: AddressUpdate):
-    if address_id not in addresses:
+@app.patch(
+    "/addresses/{address_id}",
+    response_model=AddressRead,
+    openapi_extra=request_examples(ADDRESS_UPDATE_EXAMPLES),
+    responses=response_examples(ADDRESS_READ_EXAMPLES),
+)
+async def update_address(address_id: UUID, update: AddressUpdate):
+    if address_id.int not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    stored = addresses[address_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    addresses[address_id] = AddressRead(**stored)
-    return addresses[address_id]
+    response_cache.clear("addresses")
+    addresses[address_id.int] = addresses[address_id.int].model_copy(update=changes(update, AddressRead))
+    return model_response(addresses[address_id.int])
 
 # -----------------------------------------------------------------------------
 # Exercise endpoints
 # -----------------------------------------------------------------------------
-@app.post("/exercises", response_model=ExerciseRead, status_code=201)
-def create_exercise(exercise: ExerciseCreate):
-    exercise_read = ExerciseRead(**exercise.model_dump())
-    exercises[exercise_read.id] = exercise_read
-    return exercise_read
+@app.post(
+    "/exercises",
+    response_model=ExerciseRead,
+    status_code=201,
+    openapi_extra=request_examples(EXERCISE_CREATE_EXAMPLES),
+    responses=response_examples(EXERCISE_READ_EXAMPLES, 201),
+)
+async def create_exercise(exercise: ExerciseCreate):
+    now = datetime.now(timezone.utc)
+    exercise_read = ExerciseRead.model_construct(**exercise.__dict__, created_at=now, updated_at=now)
+    response_cache.clear("exercises")
+    exercises[exercise_read.id.int] = exercise_read
+    return model_response(exercise_read, status_code=201)
 
 @app.get("/exercises", response_model=List[ExerciseRead])
-def list_exercises(
+async def list_exercises(
     name: Optional[str] = Query(None, description="Filter by exercise name"),
     muscle_group: Optional[str] = Query(None, description="Filter by muscle group"),
     equipment: Optional[str] = Query(None, description="Filter by equipment"),
     difficulty: Optional[str] = Query(None, description="Filter by difficulty level"),
 ):
-    results = list(exercises.values())
-
-    if name is not None:
-        results = [e for e in results if e.name == name]
-    if muscle_group is not None:
-        results = [e for e in results if e.muscle_group == muscle_group]
-    if equipment is not None:
-        results = [e for e in results if e.equipment == equipment]
-    if difficulty is not None:
-        results = [e for e in results if e.difficulty == difficulty]
-
-    return results
-
-@app.get("/exercises/{exercise_id}", response_model=ExerciseRead)
-def get_exercise(exercise_id: UUID):
-    if exercise_id not in exercises:
-        raise HTTPException(status_code=404, detail="Exercise not found")
-    return exercises[exercise_id]
+    key = (name, muscle_group, equipment, difficulty)
+    cached = cached_response("exercises", key)
+    if cached is not None:
+        return cached
+
+    filters = active_filters(
+        name=name, muscle_group=muscle_group, equipment=equipment, difficulty=difficulty
+    )
+    return stream_response(
+        (e for e in list(exercises.values()) if all(get(e) == value for get, value in filters)),
+        cache=("exercises", key),
+    )
 
-@app.put("/exercises/{exercise_id}", response_model=ExerciseRead)
-def replace_exercise(exercise_id: UUID, exercise: ExerciseCreate):
-    exercises[exercise_id] = ExerciseRead(**exercise.model_dump())
-    return exercises[exercise_id]
+@app.get(
+    "/exercises/{exercise_id}",
+    response_model=ExerciseRead,
+    responses=response_examples(EXERCISE_READ_EXAMPLES),
+)
+async def get_exercise(exercise_id: UUID):
+    cached = cached_response("exercises", exercise_id.int)
+    if cached is not None:
+        return cached
+    if exercise_id.int not in exercises:
+        raise HTTPException(status_code=404, detail="Exercise not found")
+    return model_response(exercises[exercise_id.int], cache=("exercises", exercise_id.int))
 
-@app.patch("/exercises/{exercise_id}", response_model=ExerciseRead)
-def update_exercise(exercise_id: UUID, update: ExerciseUpdate):
-    if exercise_id not in exercises:
+@app.put(
+    "/exercises/{exercise_id}",
+    response_model=ExerciseRead,
+    openapi_extra=request_examples(EXERCISE_CREATE_EXAMPLES),
+    responses=response_examples(EXERCISE_READ_EXAMPLES),
+)
+async def replace_exercise(exercise_id: UUID, exercise: ExerciseCreate):
+    now = datetime.now(timezone.utc)
+    response_cache.clear("exercises")
+    exercises[exercise_id.int] = ExerciseRead.model_construct(**exercise.__dict__, created_at=now, updated_at=now)
+    return model_response(exercises[exercise_id.int])
+
+@app.patch(
+    "/exercises/{exercise_id}",
+    response_model=ExerciseRead,
+    openapi_extra=request_examples(EXERCISE_UPDATE_EXAMPLES),
+    responses=response_examples(EXERCISE_READ_EXAMPLES),
+)
+async def update_exercise(exercise_id: UUID, update: ExerciseUpdate):
+    if exercise_id.int not in exercises:
         raise HTTPException(status_code=404, detail="Exercise not found")
-    stored = exercises[exercise_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    exercises[exercise_id] = ExerciseRead(**stored)
-    return exercises[exercise_id]
+    response_cache.clear("exercises")
+    exercises[exercise_id.int] = exercises[exercise_id.int].model_copy(update=changes(update, ExerciseRead))
+    return model_response(exercises[exercise_id.int])
 
 @app.delete("/exercises/{exercise_id}")
-def delete_exercise(exercise_id: UUID):
-    if exercise_id not in exercises:
+async def delete_exercise(exercise_id: UUID):
+    if exercise_id.int not in exercises:
         raise HTTPException(status_code=404, detail="Exercise not found")
-    del exercises[exercise_id]
+    response_cache.clear("exercises")
+    del exercises[exercise_id.int]
     return {"message": "Exercise deleted successfully"}
 
 # -----------------------------------------------------------------------------
 # Person endpoints
 # -----------------------------------------------------------------------------
-@app.post("/persons", response_model=PersonRead, status_code=201)
-def create_person(person: PersonCreate):
+@app.post(
+    "/persons",
+    response_model=PersonRead,
+    status_code=201,
+    openapi_extra=request_examples(PERSON_CREATE_EXAMPLES),
+    responses=response_examples(PERSON_READ_EXAMPLES, 201),
+)
+async def create_person(person: PersonCreate):
     # Each person gets its own UUID; stored as PersonRead
-    person_read = PersonRead(**person.model_dump())
-    persons[person_read.id] = person_read
-    return person_read
+    now = datetime.now(timezone.utc)
+    person_read = PersonRead.model_construct(**person.__dict__, created_at=now, updated_at=now)
+    response_cache.clear("persons")
+    persons[person_read.id.int] = person_read
+    person_positions[person_read.id.int] = len(person_positions)
+    index_person(person_read)
+    return model_response(person_read, status_code=201)
 
 @app.get("/persons", response_model=List[PersonRead])
-def list_persons(
+async def list_persons(
     uni: Optional[str] = Query(None, description="Filter by Columbia UNI"),
     first_name: Optional[str] = Query(None, description="Filter by first name"),
     last_name: Optional[str] = Query(None, description="Filter by last name"),
     email: Optional[str] = Query(None, description="Filter by email"),
     phone: Optional[str] = Query(None, description="Filter by phone number"),
-    birth_date: Optional[str] = Query(None, description="Filter by date of birth (YYYY-MM-DD)"),
+    birth_date: Optional[date] = Query(None, description="Filter by date of birth (YYYY-MM-DD)"),
     city: Optional[str] = Query(None, description="Filter by city of at least one address"),
     country: Optional[str] = Query(None, description="Filter by country of at least one address"),
 ):
-    results = list(persons.values())
-
-    if uni is not None:
-        results = [p for p in results if p.uni == uni]
-    if first_name is not None:
-        results = [p for p in results if p.first_name == first_name]
-    if last_name is not None:
-        results = [p for p in results if p.last_name == last_name]
-    if email is not None:
-        results = [p for p in results if p.email == email]
-    if phone is not None:
-        results = [p for p in results if p.phone == phone]
-    if birth_date is not None:
-        results = [p for p in results if str(p.birth_date) == birth_date]
-
+    key = (uni, first_name, last_name, email, phone, birth_date, city, country)
+    cached = cached_response("persons", key)
+    if cached is not None:
+        return cached
+
+    filters = active_filters(
+        uni=uni, first_name=first_name, last_name=last_name, email=email, phone=phone,
+        birth_date=birth_date,
+    )
     # nested address filtering
-    if city is not None:
-        results = [p for p in results if any(addr.city == city for addr in p.addresses)]
-    if country is not None:
-        results = [p for p in results if any(addr.country == country for addr in p.addresses)]
-
-    return results
-
-@app.get("/persons/{person_id}", response_model=PersonRead)
-def get_person(person_id: UUID):
-    if person_id not in persons:
+    address_filters = active_filters(city=city, country=country)
+
+    def matches(p: PersonRead) -> bool:
+        if not all(get(p) == value for get, value in filters):
+            return False
+        return all(
+            any(get(addr) == value for addr in p.addresses)
+            for get, value in address_filters
+        )
+
+    # Narrow to the intersection of the indexed filters before scanning.
+    indexed = [
+        (field, value)
+        for field, value in (("uni", uni), ("email", email), ("city", city), ("country", country))
+        if value is not None
+    ]
+    if indexed:
+        ids = set.intersection(*(person_index[field].get(value, set()) for field, value in indexed))
+        candidates = [persons[i] for i in sorted(ids, key=person_positions.__getitem__)]
+    elif (
+        person_columns is not None
+        and len(person_columns) >= COLUMN_SCAN_MIN_ROWS
+        and any(v is not None for v in (first_name, last_name, phone, birth_date))
+    ):
+        ids = person_columns.match(
+            first_name=first_name, last_name=last_name, phone=phone, birth_date=birth_date
+        )
+        candidates = [persons[i] for i in ids]
+    else:
+        candidates = list(persons.values())
+
+    return stream_response((p for p in candidates if matches(p)), cache=("persons", key))
+
+@app.get(
+    "/persons/{person_id}",
+    response_model=PersonRead,
+    responses=response_examples(PERSON_READ_EXAMPLES),
+)
+async def get_person(person_id: UUID):
+    cached = cached_response("persons", person_id.int)
+    if cached is not None:
+        return cached
+    if person_id.int not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    return persons[person_id]
+    return model_response(persons[person_id.int], cache=("persons", person_id.int))
 
-@app.patch("/persons/{person_id}", response_model=PersonRead)
-def update_person(person_id: UUID, update: PersonUpdate):
-    if person_id not in persons:
+@app.patch(
+    "/persons/{person_id}",
+    response_model=PersonRead,
+    openapi_extra=request_examples(PERSON_UPDATE_EXAMPLES),
+    responses=response_examples(PERSON_READ_EXAMPLES),
+)
+async def update_person(person_id: UUID, update: PersonUpdate):
+    if person_id.int not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    stored = persons[person_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    persons[person_id] = PersonRead(**stored)
-    return persons[person_id]
+    # Build the new record before touching the store or indexes, so a rejected
+    # update leaves both as they were.
+    updated = persons[person_id.int].model_copy(update=changes(update, PersonRead))
+    response_cache.clear("persons")
+    unindex_person(persons[person_id.int])
+    persons[person_id.int] = updated
+    index_person(updated)
+    return model_response(persons[person_id.int])
 
 # -----------------------------------------------------------------------------
 # Workout endpoints
 # -----------------------------------------------------------------------------
-@app.post("/workouts", response_model=WorkoutRead, status_code=201)
-def create_workout(workout: WorkoutCreate):
-    workout_read = WorkoutRead(**workout.model_dump())
-    workouts[workout_read.id] = workout_read
-    return workout_read
+@app.post(
+    "/workouts",
+    response_model=WorkoutRead,
+    status_code=201,
+    openapi_extra=request_examples(WORKOUT_CREATE_EXAMPLES),
+    responses=response_examples(WORKOUT_READ_EXAMPLES, 201),
+)
+async def create_workout(workout: WorkoutCreate):
+    now = datetime.now(timezone.utc)
+    workout_read = WorkoutRead.model_construct(**workout.__dict__, created_at=now, updated_at=now)
+    response_cache.clear("workouts")
+    # A client-supplied id may overwrite an existing workout; drop its old entry.
+    unindex_workout(workout_read.id.int)
+    workouts[workout_read.id.int] = workout_read
+    index_workout(workout_read.id.int, workout_read)
+    return model_response(workout_read, status_code=201)
 
 @app.get("/workouts", response_model=List[WorkoutRead])
-def list_workouts(
+async def list_workouts(
     user_name: Optional[str] = Query(None, description="Filter by user name"),
-    workout_date: Optional[str] = Query(None, description="Filter by date (YYYY-MM-DD)"),
+    workout_date: Optional[date] = Query(None, description="Filter by date (YYYY-MM-DD)"),
     duration_minutes: Optional[int] = Query(None, description="Filter by minimum duration"),
 ):
-    results = list(workouts.values())
+    key = (user_name, workout_date, duration_minutes)
+    cached = cached_response("workouts", key)
+    if cached is not None:
+        return cached
 
-    if user_name is not None:
-        results = [w for w in results if w.user_name == user_name]
-    if workout_date is not None:
-        results = [w for w in results if str(w.workout_date) == workout_date]
-    if duration_minutes is not None:
-        results = [w for w in results if w.duration_minutes and w.duration_minutes >= duration_minutes]
+    filters = active_filters(user_name=user_name, workout_date=workout_date)
 
-    return results
+    if duration_minutes is not None:
+        # (d,) sorts before every (d, key), so this walks durations >= d.
+        keys = [i for _, i in workouts_by_duration.irange((duration_minutes,))]
+        candidates = [workouts[i] for i in sorted(keys, key=workout_positions.__getitem__)]
+    else:
+        candidates = list(workouts.values())
+
+    return stream_response(
+        (w for w in candidates if all(get(w) == value for get, value in filters)),
+        cache=("workouts", key),
+    )
 
-@app.get("/workouts/{workout_id}", response_model=WorkoutRead)
-def get_workout(workout_id: UUID):
-    if workout_id not in workouts:
+@app.get(
+    "/workouts/{workout_id}",
+    response_model=WorkoutRead,
+    responses=response_examples(WORKOUT_READ_EXAMPLES),
+)
+async def get_workout(workout_id: UUID):
+    cached = cached_response("workouts", workout_id.int)
+    if cached is not None:
+        return cached
+    if workout_id.int not in workouts:
         raise HTTPException(status_code=404, detail="Workout not found")
-    return workouts[workout_id]
+    return model_response(workouts[workout_id.int], cache=("workouts", workout_id.int))
 
-@app.put("/workouts/{workout_id}", response_model=WorkoutRead)
-def replace_workout(workout_id: UUID, workout: WorkoutCreate):
-    workouts[workout_id] = WorkoutRead(**workout.model_dump())
-    return workouts[workout_id]
-
-@app.patch("/workouts/{workout_id}", response_model=WorkoutRead)
-def update_workout(workout_id: UUID, update: WorkoutUpdate):
-    if workout_id not in workouts:
+@app.put(
+    "/workouts/{workout_id}",
+    response_model=WorkoutRead,
+    openapi_extra=request_examples(WORKOUT_CREATE_EXAMPLES),
+    responses=response_examples(WORKOUT_READ_EXAMPLES),
+)
+async def replace_workout(workout_id: UUID, workout: WorkoutCreate):
+    now = datetime.now(timezone.utc)
+    response_cache.clear("workouts")
+    unindex_workout(workout_id.int)
+    workouts[workout_id.int] = WorkoutRead.model_construct(**workout.__dict__, created_at=now, updated_at=now)
+    index_workout(workout_id.int, workouts[workout_id.int])
+    return model_response(workouts[workout_id.int])
+
+@app.patch(
+    "/workouts/{workout_id}",
+    response_model=WorkoutRead,
+    openapi_extra=request_examples(WORKOUT_UPDATE_EXAMPLES),
+    responses=response_examples(WORKOUT_READ_EXAMPLES),
+)
+async def update_workout(workout_id: UUID, update: WorkoutUpdate):
+    if workout_id.int not in workouts:
         raise HTTPException(status_code=404, detail="Workout not found")
-    stored = workouts[workout_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    workouts[workout_id] = WorkoutRead(**stored)
-    return workouts[workout_id]
+    updated = workouts[workout_id.int].model_copy(update=changes(update, WorkoutRead))
+    response_cache.clear("workouts")
+    unindex_workout(workout_id.int)
+    workouts[workout_id.int] = updated
+    index_workout(workout_id.int, updated)
+    return model_response(workouts[workout_id.int])
 
 @app.delete("/workouts/{workout_id}")
-def delete_workout(workout_id: UUID):
-    if workout_id not in workouts:
+async def delete_workout(workout_id: UUID):
+    if workout_id.int not in workouts:
         raise HTTPException(status_code=404, detail="Workout not found")
-    del workouts[workout_id]
+    response_cache.clear("workouts")
+    unindex_workout(workout_id.int)
+    del workouts[workout_id.int]
+    del workout_positions[workout_id.int]
     return {"message": "Workout deleted successfully"}
 
 # -----------------------------------------------------------------------------
 # Root
 # -----------------------------------------------------------------------------
+ROOT_BODY = orjson.dumps(
+    {"message": "Welcome to the Person/Address/Exercise/Workout API. See /docs for OpenAPI UI."}
+)
+
 @app.get("/")
-def root():
-    return {"message": "Welcome to the Person/Address/Exercise/Workout API. See /docs for OpenAPI UI."}
+async def root():
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 # -----------------------------------------------------------------------------
 # Entrypoint for `python main.py`
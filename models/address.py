@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from utils.uuid_pool import fast_uuid4
+from .cached import CachedJSONModel
+from .config import BASE_CONFIG
+
 
 class AddressBase(BaseModel):
     id: UUID = Field(
-        default_factory=uuid4,
+        default_factory=fast_uuid4,
         description="Persistent Address ID (server-generated).",
         json_schema_extra={"example": "550e8400-e29b-41d4-a716-446655440000"},
     )
@@ -38,38 +42,11 @@ class AddressBase(BaseModel):
         json_schema_extra={"example": "USA"},
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "street": "123 Main St",
-                    "city": "New York",
-                    "state": "NY",
-                    "postal_code": "10001",
-                    "country": "USA",
-                }
-            ]
-        }
-    }
+    model_config = BASE_CONFIG
 
 
 class AddressCreate(AddressBase):
     """Creation payload; ID is generated server-side but present in the base model."""
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "11111111-1111-4111-8111-111111111111",
-                    "street": "221B Baker St",
-                    "city": "London",
-                    "state": None,
-                    "postal_code": "NW1 6XE",
-                    "country": "UK",
-                }
-            ]
-        }
-    }
 
 
 class AddressUpdate(BaseModel):
@@ -90,47 +67,54 @@ class AddressUpdate(BaseModel):
         None, description="Country name or ISO label.", json_schema_extra={"example": "USA"}
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "street": "124 Main St",
-                    "city": "New York",
-                    "state": "NY",
-                    "postal_code": "10002",
-                    "country": "USA",
-                },
-                {"city": "Brooklyn"},
-            ]
-        }
-    }
+    model_config = BASE_CONFIG
 
 
-class AddressRead(AddressBase):
+class AddressRead(CachedJSONModel, AddressBase):
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "street": "123 Main St",
-                    "city": "New York",
-                    "state": "NY",
-                    "postal_code": "10001",
-                    "country": "USA",
-                    "created_at": "2025-01-15T10:20:30Z",
-                    "updated_at": "2025-01-16T12:00:00Z",
-                }
-            ]
-        }
+
+# OpenAPI examples for the routes; kept out of the pydantic schemas.
+ADDRESS_CREATE_EXAMPLES = [
+    {
+        "id": "11111111-1111-4111-8111-111111111111",
+        "street": "221B Baker St",
+        "city": "London",
+        "state": None,
+        "postal_code": "NW1 6XE",
+        "country": "UK",
+    }
+]
+
+ADDRESS_UPDATE_EXAMPLES = [
+    {
+        "street": "124 Main St",
+        "city": "New York",
+        "state": "NY",
+        "postal_code": "10002",
+        "country": "USA",
+    },
+    {"city": "Brooklyn"},
+]
+
+ADDRESS_READ_EXAMPLES = [
+    {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "street": "123 Main St",
+        "city": "New York",
+        "state": "NY",
+        "postal_code": "10001",
+        "country": "USA",
+        "created_at": "2025-01-15T10:20:30Z",
+        "updated_at": "2025-01-16T12:00:00Z",
     }
+]
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, PrivateAttr
+
+
+class CachedJSONModel(BaseModel):
+    """Memoizes the JSON encoding of stored Read models.
+
+    Encoding runs once per record version in pydantic-core's serializer, straight
+    to bytes, with no intermediate Python dict; responses reuse those bytes.
+    Assigning a field or building a new instance via model_copy drops the cache.
+    """
+    _json_cache: Optional[bytes] = PrivateAttr(default=None)
+
+    def cached_json(self) -> bytes:
+        if self._json_cache is None:
+            self._json_cache = self.__pydantic_serializer__.to_json(self)
+        return self._json_cache
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> CachedJSONModel:
+        copied = super().model_copy(update=update, deep=deep)
+        copied._json_cache = None
+        return copied
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "_json_cache":
+            super().__setattr__("_json_cache", None)
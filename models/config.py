@@ -0,0 +1,10 @@
+from pydantic import ConfigDict
+
+# Shared by every model that derives directly from BaseModel. Stored records are
+# replaced via model_copy rather than mutated, so pydantic never needs to
+# re-validate existing instances or assignments; unknown keys are dropped.
+BASE_CONFIG = ConfigDict(
+    revalidate_instances="never",
+    validate_assignment=False,
+    extra="ignore",
+)
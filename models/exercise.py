@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from utils.uuid_pool import fast_uuid4
+from .cached import CachedJSONModel
+from .config import BASE_CONFIG
+
 
 class ExerciseBase(BaseModel):
     id: UUID = Field(
-        default_factory=uuid4,
+        default_factory=fast_uuid4,
         description="Persistent Exercise ID (server-generated).",
         json_schema_extra={"example": "550e8400-e29b-41d4-a716-446655440000"},
     )
@@ -43,40 +47,11 @@ class ExerciseBase(BaseModel):
         json_schema_extra={"example": 8.5},
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "name": "Push-ups",
-                    "muscle_group": "Chest",
-                    "equipment": "None",
-                    "difficulty": "Beginner",
-                    "instructions": "Start in plank position, lower body, push up",
-                    "calories_per_minute": 8.5,
-                }
-            ]
-        }
-    }
+    model_config = BASE_CONFIG
 
 
 class ExerciseCreate(ExerciseBase):
     """Creation payload; ID is generated server-side but present in the base model."""
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "11111111-1111-4111-8111-111111111111",
-                    "name": "Bench Press",
-                    "muscle_group": "Chest",
-                    "equipment": "Barbell",
-                    "difficulty": "Intermediate",
-                    "instructions": "Lie on bench, grip barbell, lower to chest, press up",
-                    "calories_per_minute": 6.0,
-                }
-            ]
-        }
-    }
 
 
 class ExerciseUpdate(BaseModel):
@@ -100,47 +75,55 @@ class ExerciseUpdate(BaseModel):
         None, description="Estimated calories burned per minute.", json_schema_extra={"example": 10.0}
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "name": "Diamond Push-ups",
-                    "muscle_group": "Triceps",
-                    "difficulty": "Advanced",
-                    "calories_per_minute": 12.0,
-                },
-                {"difficulty": "Intermediate"},
-            ]
-        }
-    }
+    model_config = BASE_CONFIG
 
 
-class ExerciseRead(ExerciseBase):
+class ExerciseRead(CachedJSONModel, ExerciseBase):
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "name": "Push-ups",
-                    "muscle_group": "Chest",
-                    "equipment": "None",
-                    "difficulty": "Beginner",
-                    "instructions": "Start in plank position, lower body, push up",
-                    "calories_per_minute": 8.5,
-                    "created_at": "2025-01-15T10:20:30Z",
-                    "updated_at": "2025-01-16T12:00:00Z",
-                }
-            ]
-        }
+
+# OpenAPI examples for the routes; kept out of the pydantic schemas.
+EXERCISE_CREATE_EXAMPLES = [
+    {
+        "id": "11111111-1111-4111-8111-111111111111",
+        "name": "Bench Press",
+        "muscle_group": "Chest",
+        "equipment": "Barbell",
+        "difficulty": "Intermediate",
+        "instructions": "Lie on bench, grip barbell, lower to chest, press up",
+        "calories_per_minute": 6.0,
+    }
+]
+
+EXERCISE_UPDATE_EXAMPLES = [
+    {
+        "name": "Diamond Push-ups",
+        "muscle_group": "Triceps",
+        "difficulty": "Advanced",
+        "calories_per_minute": 12.0,
+    },
+    {"difficulty": "Intermediate"},
+]
+
+EXERCISE_READ_EXAMPLES = [
+    {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "name": "Push-ups",
+        "muscle_group": "Chest",
+        "equipment": "None",
+        "difficulty": "Beginner",
+        "instructions": "Start in plank position, lower body, push up",
+        "calories_per_minute": 8.5,
+        "created_at": "2025-01-15T10:20:30Z",
+        "updated_at": "2025-01-16T12:00:00Z",
     }
+]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from typing import Optional, List, Annotated
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import date, datetime
 from pydantic import BaseModel, Field, EmailStr, StringConstraints
 
 from .address import AddressBase
+from utils.uuid_pool import fast_uuid4
+from .cached import CachedJSONModel
+from .config import BASE_CONFIG
 
 # Columbia UNI: 2–3 lowercase letters + 1–4 digits (e.g., abc1234)
 UNIType = Annotated[str, StringConstraints(pattern=r"^[a-z]{2,3}\d{1,4}$")]
@@ -61,58 +64,11 @@ class PersonBase(BaseModel):
         },
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "uni": "abc1234",
-                    "first_name": "Ada",
-                    "last_name": "Lovelace",
-                    "email": "ada@example.com",
-                    "phone": "+1-212-555-0199",
-                    "birth_date": "1815-12-10",
-                    "addresses": [
-                        {
-                            "id": "550e8400-e29b-41d4-a716-446655440000",
-                            "street": "123 Main St",
-                            "city": "London",
-                            "state": None,
-                            "postal_code": "SW1A 1AA",
-                            "country": "UK",
-                        }
-                    ],
-                }
-            ]
-        }
-    }
+    model_config = BASE_CONFIG
 
 
 class PersonCreate(PersonBase):
     """Creation payload for a Person."""
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "uni": "xy123",
-                    "first_name": "Grace",
-                    "last_name": "Hopper",
-                    "email": "grace.hopper@navy.mil",
-                    "phone": "+1-202-555-0101",
-                    "birth_date": "1906-12-09",
-                    "addresses": [
-                        {
-                            "id": "aaaaaaaa-aaaa-4aaa-8aaa-aaaaaaaaaaaa",
-                            "street": "1701 E St NW",
-                            "city": "Washington",
-                            "state": "DC",
-                            "postal_code": "20552",
-                            "country": "USA",
-                        }
-                    ],
-                }
-            ]
-        }
-    }
 
 
 class PersonUpdate(BaseModel):
@@ -142,70 +98,87 @@ class PersonUpdate(BaseModel):
         },
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {"first_name": "Ada", "last_name": "Byron"},
-                {"phone": "+1-415-555-0199"},
-                {
-                    "addresses": [
-                        {
-                            "id": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb",
-                            "street": "10 Downing St",
-                            "city": "London",
-                            "state": None,
-                            "postal_code": "SW1A 2AA",
-                            "country": "UK",
-                        }
-                    ]
-                },
-            ]
-        }
-    }
+    model_config = BASE_CONFIG
 
 
-class PersonRead(PersonBase):
+class PersonRead(CachedJSONModel, PersonBase):
     """Server representation returned to clients."""
     id: UUID = Field(
-        default_factory=uuid4,
+        default_factory=fast_uuid4,
         description="Server-generated Person ID.",
         json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "99999999-9999-4999-8999-999999999999",
-                    "uni": "abc1234",
-                    "first_name": "Ada",
-                    "last_name": "Lovelace",
-                    "email": "ada@example.com",
-                    "phone": "+1-212-555-0199",
-                    "birth_date": "1815-12-10",
-                    "addresses": [
-                        {
-                            "id": "550e8400-e29b-41d4-a716-446655440000",
-                            "street": "123 Main St",
-                            "city": "London",
-                            "state": None,
-                            "postal_code": "SW1A 1AA",
-                            "country": "UK",
-                        }
-                    ],
-                    "created_at": "2025-01-15T10:20:30Z",
-                    "updated_at": "2025-01-16T12:00:00Z",
-                }
-            ]
-        }
+
+# OpenAPI examples for the routes; kept out of the pydantic schemas.
+PERSON_CREATE_EXAMPLES = [
+    {
+        "uni": "xy123",
+        "first_name": "Grace",
+        "last_name": "Hopper",
+        "email": "grace.hopper@navy.mil",
+        "phone": "+1-202-555-0101",
+        "birth_date": "1906-12-09",
+        "addresses": [
+            {
+                "id": "aaaaaaaa-aaaa-4aaa-8aaa-aaaaaaaaaaaa",
+                "street": "1701 E St NW",
+                "city": "Washington",
+                "state": "DC",
+                "postal_code": "20552",
+                "country": "USA",
+            }
+        ],
+    }
+]
+
+PERSON_UPDATE_EXAMPLES = [
+    {"first_name": "Ada", "last_name": "Byron"},
+    {"phone": "+1-415-555-0199"},
+    {
+        "addresses": [
+            {
+                "id": "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb",
+                "street": "10 Downing St",
+                "city": "London",
+                "state": None,
+                "postal_code": "SW1A 2AA",
+                "country": "UK",
+            }
+        ]
+    },
+]
+
+PERSON_READ_EXAMPLES = [
+    {
+        "id": "99999999-9999-4999-8999-999999999999",
+        "uni": "abc1234",
+        "first_name": "Ada",
+        "last_name": "Lovelace",
+        "email": "ada@example.com",
+        "phone": "+1-212-555-0199",
+        "birth_date": "1815-12-10",
+        "addresses": [
+            {
+                "id": "550e8400-e29b-41d4-a716-446655440000",
+                "street": "123 Main St",
+                "city": "London",
+                "state": None,
+                "postal_code": "SW1A 1AA",
+                "country": "UK",
+            }
+        ],
+        "created_at": "2025-01-15T10:20:30Z",
+        "updated_at": "2025-01-16T12:00:00Z",
     }
+]
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from typing import Optional, List
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime, date
 from pydantic import BaseModel, Field
 
+from utils.uuid_pool import fast_uuid4
+from .cached import CachedJSONModel
+from .config import BASE_CONFIG
+
 
 class WorkoutBase(BaseModel):
     id: UUID = Field(
-        default_factory=uuid4,
+        default_factory=fast_uuid4,
         description="Persistent Workout ID (server-generated).",
         json_schema_extra={"example": "550e8400-e29b-41d4-a716-446655440000"},
     )
@@ -43,40 +47,11 @@ class WorkoutBase(BaseModel):
         json_schema_extra={"example": "Felt great, increased weights"},
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "user_name": "John Doe",
-                    "workout_date": "2025-09-14",
-                    "exercises": ["Push-ups", "Squats", "Planks"],
-                    "duration_minutes": 45,
-                    "calories_burned": 320.5,
-                    "notes": "Felt great, increased weights",
-                }
-            ]
-        }
-    }
+    model_config = BASE_CONFIG
 
 
 class WorkoutCreate(WorkoutBase):
     """Creation payload; ID is generated server-side but present in the base model."""
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "11111111-1111-4111-8111-111111111111",
-                    "user_name": "Jane Smith",
-                    "workout_date": "2025-09-15",
-                    "exercises": ["Bench Press", "Deadlifts", "Pull-ups"],
-                    "duration_minutes": 60,
-                    "calories_burned": 450.0,
-                    "notes": "New personal record on deadlifts",
-                }
-            ]
-        }
-    }
 
 
 class WorkoutUpdate(BaseModel):
@@ -100,46 +75,54 @@ class WorkoutUpdate(BaseModel):
         None, description="Additional notes about the workout.", json_schema_extra={"example": "Short but intense session"}
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "duration_minutes": 30,
-                    "calories_burned": 280.0,
-                    "notes": "Short but intense session",
-                },
-                {"exercises": ["Yoga", "Stretching"]},
-            ]
-        }
-    }
+    model_config = BASE_CONFIG
 
 
-class WorkoutRead(WorkoutBase):
+class WorkoutRead(CachedJSONModel, WorkoutBase):
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Creation timestamp (UTC).",
         json_schema_extra={"example": "2025-01-15T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        ...,
         description="Last update timestamp (UTC).",
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "user_name": "John Doe",
-                    "workout_date": "2025-09-14",
-                    "exercises": ["Push-ups", "Squats", "Planks"],
-                    "duration_minutes": 45,
-                    "calories_burned": 320.5,
-                    "notes": "Felt great, increased weights",
-                    "created_at": "2025-01-15T10:20:30Z",
-                    "updated_at": "2025-01-16T12:00:00Z",
-                }
-            ]
-        }
+
+# OpenAPI examples for the routes; kept out of the pydantic schemas.
+WORKOUT_CREATE_EXAMPLES = [
+    {
+        "id": "11111111-1111-4111-8111-111111111111",
+        "user_name": "Jane Smith",
+        "workout_date": "2025-09-15",
+        "exercises": ["Bench Press", "Deadlifts", "Pull-ups"],
+        "duration_minutes": 60,
+        "calories_burned": 450.0,
+        "notes": "New personal record on deadlifts",
+    }
+]
+
+WORKOUT_UPDATE_EXAMPLES = [
+    {
+        "duration_minutes": 30,
+        "calories_burned": 280.0,
+        "notes": "Short but intense session",
+    },
+    {"exercises": ["Yoga", "Stretching"]},
+]
+
+WORKOUT_READ_EXAMPLES = [
+    {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "user_name": "John Doe",
+        "workout_date": "2025-09-14",
+        "exercises": ["Push-ups", "Squats", "Planks"],
+        "duration_minutes": 45,
+        "calories_burned": 320.5,
+        "notes": "Felt great, increased weights",
+        "created_at": "2025-01-15T10:20:30Z",
+        "updated_at": "2025-01-16T12:00:00Z",
     }
+]
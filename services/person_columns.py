@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from models.person import PersonRead
+
+
+class PersonColumns:
+    """Columnar (numpy) mirror of the persons store's scalar filter fields.
+
+    Rows are assigned in insertion order and overwritten in place on update, so
+    a filter becomes one vectorized comparison per field instead of a Python
+    loop over every person.
+    """
+
+    TEXT_FIELDS = ("first_name", "last_name", "phone")
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._size = 0
+        self._rows: Dict[int, int] = {}
+        self._ids: List[int] = []
+        self._text = {field: np.empty(capacity, dtype=object) for field in self.TEXT_FIELDS}
+        self._birth_dates = np.full(capacity, np.datetime64("NaT"), dtype="datetime64[D]")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def upsert(self, person: PersonRead) -> None:
+        row = self._rows.get(person.id.int)
+        if row is None:
+            if self._size == len(self._birth_dates):
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._rows[person.id.int] = row
+            self._ids.append(person.id.int)
+        for field, column in self._text.items():
+            column[row] = getattr(person, field)
+        self._birth_dates[row] = person.birth_date
+
+    def match(self, **filters: Optional[Any]) -> List[int]:
+        """IDs (UUID.int) of rows equal to every non-None filter, in insertion order."""
+        mask = np.ones(self._size, dtype=bool)
+        for field, value in filters.items():
+            if value is None:
+                continue
+            if field == "birth_date":
+                mask &= self._birth_dates[:self._size] == np.datetime64(value, "D")
+            else:
+                mask &= self._text[field][:self._size] == value
+        return [self._ids[row] for row in np.flatnonzero(mask)]
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._birth_dates)
+        for field, column in self._text.items():
+            grown = np.empty(capacity, dtype=object)
+            grown[:self._size] = column[:self._size]
+            self._text[field] = grown
+        birth_dates = np.full(capacity, np.datetime64("NaT"), dtype="datetime64[D]")
+        birth_dates[:self._size] = self._birth_dates[:self._size]
+        self._birth_dates = birth_dates
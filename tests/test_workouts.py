@@ -0,0 +1,66 @@
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+@pytest.fixture(autouse=True)
+def empty_workouts():
+    main.workouts.clear()
+    main.workouts_by_duration.clear()
+    main.workout_positions.clear()
+    main.response_cache.clear("workouts")
+    yield
+
+
+def post_workout(duration_minutes, workout_id=None):
+    body = {"user_name": "Jane Smith", "workout_date": "2025-09-15", "duration_minutes": duration_minutes}
+    if workout_id is not None:
+        body["id"] = workout_id
+    response = client.post("/workouts", json=body)
+    assert response.status_code == 201
+    return response.json()
+
+
+def durations(**params):
+    response = client.get("/workouts", params=params)
+    assert response.status_code == 200
+    return [w["duration_minutes"] for w in response.json()]
+
+
+def test_repost_with_lower_duration_drops_old_index_entry():
+    workout_id = str(uuid4())
+    post_workout(60, workout_id)
+    post_workout(10, workout_id)
+
+    assert durations(duration_minutes=50) == []
+    assert durations(duration_minutes=5) == [10]
+
+
+def test_repost_with_same_duration_is_listed_once():
+    workout_id = str(uuid4())
+    post_workout(45, workout_id)
+    post_workout(45, workout_id)
+
+    assert durations(duration_minutes=30) == [45]
+
+    assert client.delete(f"/workouts/{workout_id}").status_code == 200
+    assert durations(duration_minutes=30) == []
+    assert len(main.workouts_by_duration) == 0
+
+
+def test_duration_filter_keeps_insertion_order():
+    post_workout(10)
+    replaced = post_workout(30)
+    post_workout(5)
+
+    assert durations() == [10, 30, 5]
+    assert durations(duration_minutes=1) == [10, 30, 5]
+
+    body = {"user_name": "Jane Smith", "workout_date": "2025-09-15", "duration_minutes": 40}
+    assert client.put(f"/workouts/{replaced['id']}", json=body).status_code == 200
+    assert durations(duration_minutes=1) == durations() == [10, 40, 5]
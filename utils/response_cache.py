@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+
+class ResponseCache:
+    """In-process LRU cache of encoded GET response bodies, grouped by namespace.
+
+    Each namespace is bounded both by entry count and by total body bytes.
+    Writes clear their resource's namespace and bump its generation; a body
+    computed before the bump (e.g. a list still streaming when a write lands)
+    is rejected by put() instead of being cached stale.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_body_size: int = 256 * 1024,
+        max_namespace_bytes: int = 4 * 1024 * 1024,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_body_size = max_body_size
+        self.max_namespace_bytes = max_namespace_bytes
+        self._entries: Dict[str, OrderedDict[Hashable, bytes]] = {}
+        self._sizes: Dict[str, int] = {}
+        self._generations: Dict[str, int] = {}
+
+    def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    def get(self, namespace: str, key: Hashable) -> Optional[bytes]:
+        entries = self._entries.get(namespace)
+        if entries is None or key not in entries:
+            return None
+        entries.move_to_end(key)
+        return entries[key]
+
+    def put(self, namespace: str, key: Hashable, body: bytes, generation: int) -> None:
+        if generation != self.generation(namespace) or len(body) > self.max_body_size:
+            return
+        entries = self._entries.setdefault(namespace, OrderedDict())
+        size = self._sizes.get(namespace, 0)
+        if key in entries:
+            size -= len(entries[key])
+        entries[key] = body
+        entries.move_to_end(key)
+        size += len(body)
+        while len(entries) > self.max_entries or size > self.max_namespace_bytes:
+            _, evicted = entries.popitem(last=False)
+            size -= len(evicted)
+        self._sizes[namespace] = size
+
+    def clear(self, namespace: str) -> None:
+        self._entries.pop(namespace, None)
+        self._sizes.pop(namespace, None)
+        self._generations[namespace] = self.generation(namespace) + 1